@@ -24,6 +24,7 @@ from config_guard.params import (
     get_param_spec,
     list_params,
     register_param,
+    register_params,
     resolve_param_name,
 )
 from config_guard.validation import ValidatorProtocol
@@ -39,6 +40,7 @@ __all__ = [
     "ConfigBypassError",
     "ConfigTornDownError",
     "register_param",
+    "register_params",
     "get_param_spec",
     "list_params",
     "resolve_param_name",
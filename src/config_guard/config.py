@@ -8,7 +8,7 @@ import warnings
 from contextlib import contextmanager
 from functools import wraps
 from types import MappingProxyType, TracebackType
-from typing import Any, Callable, Dict, Iterator, Optional, Type, TypeVar, cast
+from typing import Any, Callable, Dict, Iterator, Mapping, Optional, Type, TypeVar, cast
 
 from config_guard.exceptions import ConfigBypassError, ConfigTornDownError, ConfigValidationError
 
@@ -16,7 +16,7 @@ from .history import History
 from .hooks import Hook, HookBus
 from .integrity import IntegrityGuard
 from .locks import LockGuard
-from .params import get_all_specs, register_param, resolve_and_get, resolve_param_name
+from .params import _all_specs, register_param, resolve_and_get, resolve_param_name
 from .store.manager import ConfigStore
 from .utils import _immutable_copy, _require_bypass_env
 from .validation.base import ConfigValidator
@@ -53,6 +53,17 @@ class AppConfig:
     Use teardown() to clear state, and reset_singleton() for test environments.
     """
 
+    __slots__ = (
+        "__lock",
+        "__torn_down",
+        "__lock_guard",
+        "__validator",
+        "__history",
+        "__store",
+        "__integrity",
+        "__hooks",
+    )
+
     SCHEMA_VERSION = 1
     HASH_ALGORITHM = "sha256"
 
@@ -84,7 +95,7 @@ class AppConfig:
 
         if schema is not None:
             for param, spec in schema.items():
-                if param not in get_all_specs():
+                if param not in _all_specs():
                     register_param(**spec, name=param)
                     logger.info("Registered param from schema: %r", param)
                 else:
@@ -95,7 +106,7 @@ class AppConfig:
 
         # init values
         bypass_startup = bool(initial_values.pop("_bypass", False))
-        for param, spec in get_all_specs().items():
+        for param, spec in _all_specs().items():
             logger.debug("Initializing param %r with spec %r", param, spec)
             val = _immutable_copy(initial_values.get(param, spec["default"]))
             if bypass_startup:
@@ -114,7 +125,7 @@ class AppConfig:
                 self.__store.set(canon or param, val, permanent=True, reason="initialization")
 
         # initial snapshot + checker
-        self.__integrity.update_snapshot(self.__store.snapshot_internal())
+        self.__integrity.update_snapshot(self.__store.snapshot_public())
         self.__integrity.start_checker(
             is_torn_down=lambda: self.__torn_down,
             on_violation=lambda msg: logger.critical(msg),
@@ -268,36 +279,28 @@ class AppConfig:
             del frame
 
     def _apply_changes(self, changes: Dict[str, Any], *, permanent: bool, reason: str) -> None:
-        # record before/after snapshot for the full change
-        before = self.__store.snapshot_internal()
+        if not changes:
+            # Nothing to apply: state, checksum and hooks are all unaffected
+            return
         modified_by = self._caller_id()
         for param, val in changes.items():
-            # pass modified_by so history entries are accurate
+            # pass modified_by so history entries are accurate; ConfigStore.set records them
             self.__store.set(
                 param, val, permanent=permanent, reason=reason, modified_by=modified_by
             )
-        # History will maintain last-change metadata itself; store.add_entry is handled by ConfigStore
+        run_hooks = self.__hooks.has_hooks
+        if not (permanent or run_hooks):
+            # use-once change with no hooks: nobody reads the snapshot
+            return
         after = self.__store.snapshot_internal()
-        try:
-            # also add a consolidated history entry for this multi-key change
-            # If a History adaptor is present the store/other components will call add_entry;
-            # otherwise, best-effort: call it here to ensure a consolidated entry exists.
-            hist = getattr(self, "__history", None)
-            if hist is not None:
-                hist.add_entry(
-                    modified_by=modified_by,
-                    keys=list(changes.keys()),
-                    reason=reason,
-                    before=before,
-                    after=after,
-                )
-        except Exception:
-            pass
-        self.__integrity.update_snapshot(after)
-        self.__hooks.run(after)
+        if permanent:
+            # use-once values never reach the permanent store, so the checksum is unchanged
+            self.__integrity.update_snapshot(after)
+        if run_hooks:
+            self.__hooks.run(after)
 
     def _validate_and_resolve(
-        self, input_dict: Dict[str, Any], *, bypass: bool = False, context: str = "update"
+        self, input_dict: Mapping[str, Any], *, bypass: bool = False, context: str = "update"
     ) -> Dict[str, Any]:
         """
         Resolve and validate input values.
@@ -357,11 +360,10 @@ class AppConfig:
         """
         Get the value of a configuration parameter.
         """
-        # Resolve and obtain spec, using resolve_and_get to avoid duplicate work
-        name, param = resolve_and_get(key)
-        default = _immutable_copy(param.default) if default is None else default
-
         with self.__lock:
+            # Resolve through the store's per-key cache; store.get then hits it again by name
+            name, param = self.__store.resolve(key)
+            default = _immutable_copy(param.default) if default is None else default
             return self.__store.get(name, default)
 
     @is_torn_down
@@ -373,9 +375,10 @@ class AppConfig:
             return self.__store.snapshot_public()
 
     @is_torn_down
-    def restore_from_snapshot(self, snapshot: Dict[str, Any], _bypass: bool = False) -> None:
+    def restore_from_snapshot(self, snapshot: Mapping[str, Any], _bypass: bool = False) -> None:
         """
-        Restore configuration from a snapshot dictionary.
+        Restore configuration from a snapshot mapping, e.g. the view returned by snapshot().
+        The mapping is read once and not copied.
         """
         if not snapshot:
             return
@@ -384,11 +387,14 @@ class AppConfig:
             resolved_kwargs = self._validate_and_resolve(
                 snapshot, bypass=_bypass, context="restore_from_snapshot"
             )
-            self.__store.restore(
+            # values from _validate_and_resolve are already frozen
+            self.__store.restore_frozen(
                 resolved_kwargs, modified_by=self._caller_id(), reason="restore_from_snapshot"
             )
-            self.__integrity.update_snapshot(self.__store.snapshot_internal())
-            self.__hooks.run(self.__store.snapshot_internal())
+            after = self.__store.snapshot_internal()
+            self.__integrity.update_snapshot(after)
+            if self.__hooks.has_hooks:
+                self.__hooks.run(after)
             logger.info("Config restored from snapshot keys=%s", list(resolved_kwargs.keys()))
 
     @is_torn_down
@@ -405,7 +411,7 @@ class AppConfig:
         Context manager for temporary configuration changes. Restores state on exit.
         """
         with self.__lock:
-            prior_config = self.__store.snapshot_internal()
+            prior_config = self.__store.snapshot_refs()
             prior_checksum = self.__integrity.last_checksum
             try:
                 resolved_kwargs = self._validate_and_resolve(
@@ -418,7 +424,7 @@ class AppConfig:
                 logger.error("Exception in temp_update context: %s", exc)
                 raise
             finally:
-                self.__store.restore(
+                self.__store.restore_frozen(
                     prior_config, modified_by=self._caller_id(), reason="temp_update_revert"
                 )
                 self.__integrity.update_snapshot(prior_config)
@@ -495,7 +501,7 @@ class AppConfig:
             raise ConfigTornDownError("Config has been torn down")
         with self.__lock:
             # Avoid exposing mutable internals; avoid iterator over live dict
-            return iter(tuple(self.__store.snapshot_public().keys()))
+            return iter(self.__store.keys())
 
     def __getitem__(self, key: str) -> Any:
         """
@@ -509,7 +515,7 @@ class AppConfig:
         """
         with self.__lock:
             canon = resolve_param_name(key)
-            return canon in self.__store.snapshot_internal()
+            return canon in self.__store
 
     def __len__(self) -> int:
         """
@@ -519,7 +525,7 @@ class AppConfig:
             logger.error("Attempted len() after teardown.")
             raise ConfigTornDownError("Config has been torn down")
         with self.__lock:
-            return len(self.__store.snapshot_internal())
+            return len(self.__store)
 
     def __setitem__(self, key: str, value: Any) -> None:
         """
@@ -546,7 +552,7 @@ class AppConfig:
         with first.__lock:
             with second.__lock:
                 return (
-                    self.__store.snapshot_internal() == other.__store.snapshot_internal()
+                    self.__store.snapshot_public() == other.__store.snapshot_public()
                     and self.__lock_guard.is_locked() == other.__lock_guard.is_locked()
                     and self.__torn_down == other.__torn_down
                     and self.__integrity.last_checksum == other.__integrity.last_checksum
@@ -559,7 +565,7 @@ class AppConfig:
         with self.__lock:
             return hash(
                 (
-                    frozenset(self.__store.snapshot_internal().items()),
+                    frozenset(self.__store.snapshot_public().items()),
                     self.__lock_guard.is_locked(),
                     self.__torn_down,
                     self.__integrity.last_checksum,
@@ -1,10 +1,14 @@
 from __future__ import annotations
 
 import datetime
+import logging
 import threading
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional
 
+logger = logging.getLogger("config_guard.history")
+logger.addHandler(logging.NullHandler())
+
 
 @dataclass(frozen=True)
 class HistoryEntry:
@@ -42,14 +46,27 @@ class History:
         before: Dict[str, Any],
         after: Dict[str, Any],
     ) -> None:
-        entry = HistoryEntry(
-            timestamp=datetime.datetime.now(tz=datetime.timezone.utc),
-            modified_by=modified_by,
-            reason=reason or "",
-            keys=list(keys),
-            before=dict(before),
-            after=dict(after),
-        )
+        """Record a change.
+
+        `before` and `after` are expected to hold values already frozen by the
+        store (see utils._immutable_copy); they are copied shallowly and the
+        values themselves are kept by reference, never deep-copied.
+
+        Recording is best-effort: an entry that cannot be built is logged and
+        dropped rather than failing the configuration change itself.
+        """
+        try:
+            entry = HistoryEntry(
+                timestamp=datetime.datetime.now(tz=datetime.timezone.utc),
+                modified_by=modified_by,
+                reason=reason or "",
+                keys=list(keys),
+                before=dict(before),
+                after=dict(after),
+            )
+        except Exception as exc:
+            logger.debug("Dropping history entry that could not be recorded: %s", exc)
+            return
         with self._lock:
             self._entries.append(entry)
             # update last-change metadata
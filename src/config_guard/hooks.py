@@ -10,6 +10,8 @@ Hook = Callable[[Dict[str, Any]], None]
 
 
 class HookBus:
+    __slots__ = ("_hooks", "_failure_mode")
+
     def __init__(self, failure_mode: Literal["ignore", "log", "raise"] = "ignore") -> None:
         self._hooks: List[Hook] = []
 
@@ -17,13 +19,21 @@ class HookBus:
             raise ValueError("failure_mode must be one of 'ignore', 'log', 'raise'")
         self._failure_mode = failure_mode
 
+    @property
+    def has_hooks(self) -> bool:
+        """True if at least one hook is registered; lets callers skip building a snapshot."""
+        return bool(self._hooks)
+
     def register(self, func: Hook) -> None:
         if not callable(func):
             raise TypeError("Hook must be callable")
         self._hooks.append(func)
 
     def run(self, config_snapshot: Dict[str, Any]) -> None:
-        for hook in self._hooks:
+        hooks = self._hooks
+        if not hooks:
+            return
+        for hook in hooks:
             try:
                 hook(config_snapshot)
             except Exception as exc:
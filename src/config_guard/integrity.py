@@ -2,20 +2,29 @@ from __future__ import annotations
 
 import hashlib
 import hmac
-import json
 import logging
 import os
 import threading
 from copy import deepcopy
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple
 
-from .utils import _checksum_of_config
+from .utils import _checksum_of_config, _is_deeply_frozen
 
 logger = logging.getLogger("config_guard.integrity")
 logger.addHandler(logging.NullHandler())
 
 
 class IntegrityGuard:
+    __slots__ = (
+        "_algo",
+        "_last_snapshot",
+        "_last_checksum",
+        "_checker_thread",
+        "_stop_event",
+        "_fingerprint_cache",
+        "_hmac_template",
+    )
+
     def __init__(self, hash_algorithm: str = "sha256") -> None:
         if not hasattr(hashlib, hash_algorithm):
             raise ValueError(f"Unknown hash algorithm: {hash_algorithm}")
@@ -24,6 +33,10 @@ class IntegrityGuard:
         self._last_checksum: Optional[str] = None
         self._checker_thread: Optional[threading.Thread] = None
         self._stop_event: threading.Event = threading.Event()
+        # (pid, checksum, fingerprint) from the last memory_fingerprint() call
+        self._fingerprint_cache: Optional[Tuple[int, Optional[str], str]] = None
+        # (key, keyed HMAC) for the last CONFIG_HMAC_KEY seen; copied per seal
+        self._hmac_template: Optional[Tuple[str, hmac.HMAC]] = None
 
     @property
     def last_checksum(self) -> Optional[str]:
@@ -41,14 +54,24 @@ class IntegrityGuard:
         - TypeError: If the key or checksum are of invalid types.
         - Exception: For any other exceptions raised during HMAC computation.
         """
-        key = os.getenv("CONFIG_HMAC_KEY", "")
+        key = os.environ.get("CONFIG_HMAC_KEY", "")
         if not key:
             return checksum
-        # Use algorithm name directly as digestmod to satisfy hmac.new contract
-        return hmac.new(key.encode(), checksum.encode(), self._algo).hexdigest()
-
-    def update_snapshot(self, snapshot: Dict[str, Any]) -> None:
-        self._last_snapshot = {k: deepcopy(v) for k, v in snapshot.items()}
+        # The key is still read on every call so rotating it takes effect immediately;
+        # only the keyed HMAC state is reused while the key is unchanged.
+        template = self._hmac_template
+        if template is None or template[0] != key:
+            # Use algorithm name directly as digestmod to satisfy hmac.new contract
+            template = self._hmac_template = (key, hmac.new(key.encode(), digestmod=self._algo))
+        mac = template[1].copy()
+        mac.update(checksum.encode())
+        return mac.hexdigest()
+
+    def update_snapshot(self, snapshot: Mapping[str, Any]) -> None:
+        # Deeply frozen values (see utils._immutable_copy) cannot change under us; copy the rest
+        self._last_snapshot = {
+            k: v if _is_deeply_frozen(v) else deepcopy(v) for k, v in snapshot.items()
+        }
         raw = _checksum_of_config(self._last_snapshot, self._algo)
         self._last_checksum = self.seal_checksum(raw)
 
@@ -57,21 +80,35 @@ class IntegrityGuard:
             return False
         raw = _checksum_of_config(self._last_snapshot, self._algo)
         sealed = self.seal_checksum(raw)
-        return sealed == self._last_checksum
+        return hmac.compare_digest(sealed, self._last_checksum)
 
     def start_checker(
-        self, *, is_torn_down: Callable[[], bool], on_violation: Callable[[str], None]
+        self,
+        *,
+        is_torn_down: Callable[[], bool],
+        on_violation: Callable[[str], None],
+        interval: float = 0.1,
     ) -> None:
+        """
+        Start a daemon thread that re-verifies the snapshot every `interval` seconds.
+
+        Each pass recomputes the full checksum, so tampering with the stored
+        snapshot in place is caught; raise `interval` to trade detection
+        latency for CPU on large configs.
+        """
+        if interval <= 0:
+            raise ValueError("interval must be positive")
         # reset stop event when starting
         self._stop_event.clear()
+        stop_event = self._stop_event
 
         def _loop() -> None:
-            # Run until torn down or stop requested; wait on the stop event with a short timeout
-            while not is_torn_down() and not self._stop_event.is_set():
+            # Run until torn down or stop requested; waiting on the stop event lets stop() interrupt promptly
+            while not is_torn_down():
                 if not self.verify():
                     on_violation("AppConfig integrity violation detected")
-                # Wait on the shared stop event with a short timeout so stop() can interrupt promptly
-                self._stop_event.wait(0.1)
+                if stop_event.wait(interval):
+                    break
             logger.debug(
                 "Integrity checker loop exiting. torn_down=%s stop=%s",
                 is_torn_down(),
@@ -92,11 +129,18 @@ class IntegrityGuard:
         self._checker_thread = None
 
     def memory_fingerprint(self) -> str:
-        data = {
-            "pid": os.getpid(),
-            "checksum": self._last_checksum,
-        }
-        return hashlib.sha256(json.dumps(data, sort_keys=True).encode()).hexdigest()
+        pid = os.getpid()
+        checksum = self._last_checksum
+        cached = self._fingerprint_cache
+        if cached is not None and cached[0] == pid and cached[1] == checksum:
+            return cached[2]
+        # Same bytes as json.dumps({"pid": ..., "checksum": ...}, sort_keys=True);
+        # checksums are hex digests, so no JSON escaping is needed
+        checksum_json = "null" if checksum is None else f'"{checksum}"'
+        payload = f'{{"checksum": {checksum_json}, "pid": {pid}}}'
+        fingerprint = hashlib.sha256(payload.encode()).hexdigest()
+        self._fingerprint_cache = (pid, checksum, fingerprint)
+        return fingerprint
 
     def join(self) -> None:
         if self._checker_thread:
@@ -7,6 +7,8 @@ from .utils import _require_bypass_env
 
 
 class LockGuard:
+    __slots__ = ("_locked",)
+
     def __init__(self) -> None:
         self._locked = False
 
@@ -14,10 +16,10 @@ class LockGuard:
         self._locked = True
 
     def unlock(self, *, _bypass: bool = False) -> None:
-        if _bypass and _require_bypass_env():
+        if _bypass:
+            if not _require_bypass_env():
+                raise ConfigBypassError()
             self._locked = False
-        elif _bypass and not _require_bypass_env():
-            raise ConfigBypassError()
         elif not self._locked:
             pass  # Already unlocked
         elif not _bypass and self._locked:
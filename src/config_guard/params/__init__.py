@@ -3,7 +3,11 @@ from __future__ import annotations
 import logging
 from enum import Enum
 from functools import lru_cache
-from typing import Any, Callable, Dict, Mapping, Optional, Tuple, Type, Union
+from itertools import islice
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterable, Mapping, Optional, Tuple, Type, Union
+
+from config_guard.utils import _BOUNDED_LEN_TYPES, _NUM_TYPES
 
 from .registry import ParamRegistry
 from .spec import ParamSpec
@@ -14,6 +18,7 @@ logger.addHandler(logging.NullHandler())
 __all__ = [
     "ParamSpec",
     "register_param",
+    "register_params",
     "get_param_spec",
     "list_params",
     "resolve_param_name",
@@ -39,69 +44,156 @@ def register_param(
     min: Optional[Union[int, float]] = None,
     max: Optional[Union[int, float]] = None,
     require_reason: bool = False,
+    memoize_validator: bool = False,
 ) -> None:
+    spec = _build_param_spec(
+        name,
+        default=default,
+        value_type=value_type,
+        validator=validator,
+        bounds=bounds,
+        description=description,
+        min_length=min_length,
+        max_length=max_length,
+        min=min,
+        max=max,
+        require_reason=require_reason,
+        memoize_validator=memoize_validator,
+    )
+    REGISTRY.register(spec, aliases=aliases, override=override)
+
+
+def register_params(params: Iterable[Mapping[str, Any]], *, override: bool = False) -> None:
+    """Register several params, each given as a mapping of register_param() arguments.
+
+    `override` applies to the whole batch and may not appear in an entry. Every
+    spec is built and checked before the first one is registered, so an invalid
+    entry leaves the registry untouched.
+    """
+    pending = []
+    for kwargs in params:
+        kwargs = dict(kwargs)
+        if "override" in kwargs:
+            raise ValueError(
+                f"override is set for the whole batch, not per param (got it for {kwargs.get('name')!r})"
+            )
+        aliases = kwargs.pop("aliases", ())
+        pending.append((_build_param_spec(**kwargs), aliases))
+    REGISTRY.register_many(pending, override=override)
+
+
+def _build_param_spec(
+    name: str,
+    *,
+    default: Optional[Any] = None,
+    value_type: Optional[Union[Type[Any], Tuple[Type[Any], ...]]] = None,
+    validator: Optional[Callable[[Any], bool]] = None,
+    bounds: Optional[Tuple[Union[int, float], Union[int, float]]] = None,
+    description: str | None = None,
+    min_length: Optional[int] = None,
+    max_length: Optional[int] = None,
+    min: Optional[Union[int, float]] = None,
+    max: Optional[Union[int, float]] = None,
+    require_reason: bool = False,
+    memoize_validator: bool = False,
+) -> ParamSpec:
+    if validator is not None and not callable(validator):
+        raise TypeError("validator must be callable")
+    if (
+        bounds is not None
+        or min is not None
+        or max is not None
+        or min_length is not None
+        or max_length is not None
+    ):
+        bounds = _compute_bounds(
+            value_type,
+            bounds=bounds,
+            min_length=min_length,
+            max_length=max_length,
+            min_value=min,
+            max_value=max,
+        )
+    if value_type is None:
+        if default is not None:
+            value_type = type(default)
+        else:
+            value_type = (str, int, float, bool, list, dict)
+
+    return ParamSpec(
+        name=name,
+        default=default,
+        value_type=value_type,
+        validator=validator,
+        bounds=bounds,
+        description=description,
+        require_reason=require_reason,
+        memoize_validator=memoize_validator,
+    )
+
+
+def _compute_bounds(
+    value_type: Optional[Union[Type[Any], Tuple[Type[Any], ...]]],
+    *,
+    bounds: Optional[Tuple[Union[int, float], Union[int, float]]],
+    min_length: Optional[int],
+    max_length: Optional[int],
+    min_value: Optional[Union[int, float]],
+    max_value: Optional[Union[int, float]],
+) -> Optional[Tuple[Union[int, float], Union[int, float]]]:
+    """Reconcile bounds, min/max and min_length/max_length into a single bounds tuple."""
     if bounds is not None:
-        if not (isinstance(bounds, tuple) and len(bounds) == 2):
+        try:
+            lo, hi = bounds
+        except (TypeError, ValueError):
+            raise ValueError("bounds must be a tuple of (min, max)") from None
+        # Unpacking alone accepts any 2-item iterable, e.g. the string "19"
+        if not (isinstance(lo, _NUM_TYPES) and isinstance(hi, _NUM_TYPES)):
             raise ValueError("bounds must be a tuple of (min, max)")
-        if min is not None or max is not None:
+        if min_value is not None or max_value is not None:
             raise ValueError("Cannot specify both bounds and min/max")
-        min, max = bounds
+        min_value, max_value = lo, hi
     if min_length is not None or max_length is not None:
-        if value_type not in (str, list, tuple, dict):
+        if value_type not in _BOUNDED_LEN_TYPES:
             raise ValueError(
                 "min_length/max_length can only be used with str, list, tuple, or dict types"
             )
         if bounds is not None:
             raise ValueError("Cannot specify both bounds and min_length/max_length")
         bounds = (min_length or 0, max_length or 0)
-    if min is not None or max is not None:
-        print(min, max)
-        if value_type not in (int, float) and value_type != (int, float):
+    if min_value is not None or max_value is not None:
+        if value_type not in _NUM_TYPES and value_type != _NUM_TYPES:
             raise ValueError("min/max can only be used with int or float types")
-        if min is None or max is None:
+        if min_value is None or max_value is None:
             raise ValueError("Both min and max must be provided when using min/max")
         # keep numeric types as provided (int vs float)
-        bounds = (min, max)
-    if value_type is None:
-        if default is not None:
-            value_type = type(default)
-        else:
-            value_type = (str, int, float, bool, list, dict)
-
-    REGISTRY.register(
-        ParamSpec(
-            name=name,
-            default=default,
-            value_type=value_type,
-            validator=validator,
-            bounds=bounds,
-            description=description,
-            require_reason=require_reason,
-        ),
-        aliases=aliases,
-        override=override,
-    )
+        bounds = (min_value, max_value)
+    return bounds
 
 
 def get_param_spec(key: "Enum | str") -> ParamSpec:
     """
     Return the ParamSpec for `key`.
 
-    Optimization: if the caller provides a string that already looks like a canonical
-    registry key (stripped, uppercased and present in the registry) bypass the
-    full resolution path to avoid doing two lookups for the same parameter
-    (common pattern: resolve_param_name(key) followed by get_param_spec(key)).
+    Optimization: string keys are looked up directly in the registry's flat
+    name/alias table, first as given (canonical names and aliases need no
+    normalization) and then stripped and uppercased, bypassing the full
+    resolution path (common pattern: resolve_param_name(key) followed by
+    get_param_spec(key)). The table is maintained by the registry itself,
+    so there is nothing to invalidate here.
     """
     # Fast-path common case: canonical string already provided
     if isinstance(key, str):
-        k = key.strip().upper()
-        # Accessing the internal _specs dict here is a small, deliberate
+        # Accessing the internal tables here is a small, deliberate
         # micro-optimization to avoid calling REGISTRY._resolve_key again.
-        try:
-            return REGISTRY._specs[k]
-        except KeyError:
-            # fall back to the normal resolution path
-            return REGISTRY.get(key)
+        lookup = REGISTRY._lookup
+        name = lookup.get(key)
+        if name is None:
+            name = lookup.get(key.strip().upper())
+        if name is not None:
+            return REGISTRY._specs[name]
+        # fall back to the normal resolution path (raises for unknown keys)
+        return REGISTRY.get(key)
     # Non-string (e.g. Enum) or other cases use the normal (safe) path
     return REGISTRY.get(key)
 
@@ -116,11 +208,13 @@ def resolve_param_name(key: "Enum | str") -> str:
     return REGISTRY.resolve_name(key)
 
 
+@lru_cache(maxsize=1024)
 def resolve_and_get(key: "Enum | str") -> tuple[str, ParamSpec]:
     """Resolve `key` and return tuple (canonical_name, ParamSpec).
 
     This is a single-call helper to avoid callers doing resolve + get
-    (two dictionary lookups) in hot paths.
+    (two dictionary lookups) in hot paths. Cached like resolve_param_name,
+    so repeated lookups of the same key skip canonicalization entirely.
     """
     name = resolve_param_name(key)
     return name, get_param_spec(name)
@@ -130,8 +224,27 @@ def list_params() -> Tuple[str, ...]:
     return REGISTRY.all_names()
 
 
+# (registry version, specs view) from the last get_all_specs() call
+_all_specs_cache: Optional[Tuple[int, Mapping[str, Mapping[str, Any]]]] = None
+
+
 def get_all_specs() -> Mapping[str, Dict[str, Any]]:
-    return {name: REGISTRY.get(name).to_mapping() for name in REGISTRY.all_names()}
+    return {name: dict(spec) for name, spec in _all_specs().items()}
+
+
+def _all_specs() -> Mapping[str, Mapping[str, Any]]:
+    """Shared read-only view behind get_all_specs(), rebuilt only when the registry changes."""
+    global _all_specs_cache
+    cached = _all_specs_cache
+    if cached is not None and cached[0] == REGISTRY.version:
+        return cached[1]
+    specs = MappingProxyType({name: REGISTRY.get(name)._mapping() for name in REGISTRY.all_names()})
+    _all_specs_cache = (REGISTRY.version, specs)
+    return specs
+
+
+# (registry version, max_items, state) from the last dump_registry_state() call
+_dump_cache: Optional[Tuple[int, int, Dict[str, Any]]] = None
 
 
 def dump_registry_state(max_items: int = 20) -> Dict[str, Any]:
@@ -139,25 +252,31 @@ def dump_registry_state(max_items: int = 20) -> Dict[str, Any]:
     Diagnostic helper to inspect current registry state for debugging purposes.
     Returns a dict with counts and samples of specs/aliases.
     """
-    specs_keys = list(REGISTRY._specs.keys())
-    aliases_items = list(REGISTRY._aliases.items())
-    state = {
-        "id": hex(id(REGISTRY)),
-        "specs_count": len(specs_keys),
-        "aliases_count": len(aliases_items),
-        "specs_sample": tuple(specs_keys[:max_items]),
-        "aliases_sample": tuple(aliases_items[:max_items]),
-    }
+    global _dump_cache
+    cached = _dump_cache
+    if cached is not None and cached[0] == REGISTRY.version and cached[1] == max_items:
+        state = cached[2]
+    else:
+        # Only the samples are materialized; counts come straight from the dicts
+        state = {
+            "id": hex(id(REGISTRY)),
+            "specs_count": len(REGISTRY._specs),
+            "aliases_count": len(REGISTRY._aliases),
+            "specs_sample": tuple(islice(REGISTRY._specs, max_items)),
+            "aliases_sample": tuple(islice(REGISTRY._aliases.items(), max_items)),
+        }
+        _dump_cache = (REGISTRY.version, max_items, state)
     logger.debug("dump_registry_state -> %r", state)
-    return state
+    # Callers get their own dict; the cached one is never handed out
+    return dict(state)
+
+
+def _clear_resolve_caches() -> None:
+    resolve_param_name.cache_clear()
+    resolve_and_get.cache_clear()
 
 
-# Wire up cache clearing so registry operations can clear the resolve_name cache
+# Wire up cache clearing so registry operations can clear the resolve caches
 # if/when the registry changes (new params / aliases). This is attached after
-# the function is created to avoid circular import issues.
-try:
-    # resolve_param_name is decorated with lru_cache, so expose its cache_clear
-    REGISTRY._clear_caches = resolve_param_name.cache_clear
-except Exception:
-    # No caching available or assignment failed; ignore silently
-    REGISTRY._clear_caches = lambda: None
+# the functions are created to avoid circular import issues.
+REGISTRY._clear_caches = _clear_resolve_caches
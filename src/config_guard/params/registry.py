@@ -1,8 +1,11 @@
 from __future__ import annotations
 
 import logging
+import sys
+from bisect import insort
 from enum import Enum
-from typing import Dict, Iterable, Tuple, Union
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
 
 from config_guard.exceptions import ConfigDuplicateError, ConfigNotFoundError, ConfigValidationError
 
@@ -16,12 +19,29 @@ class ParamRegistry:
     def __init__(self) -> None:
         self._specs: Dict[str, ParamSpec] = {}
         self._aliases: Dict[str, str] = {}
-        logger.debug(
-            "ParamRegistry initialized id=%s specs=%d aliases=%d",
-            hex(id(self)),
-            len(self._specs),
-            len(self._aliases),
-        )
+        # Canonical names and aliases -> canonical name, so a hit costs one probe.
+        # Names take precedence over aliases when both spell the same key.
+        self._lookup: Dict[str, str] = {}
+        # Enum value -> canonical name, skipping _canon on repeats. Keyed by the value
+        # string, not the member, so resolving never keeps an Enum class alive.
+        self._enum_cache: Dict[str, str] = {}
+        # Canonical names kept sorted on insert; all_names() snapshots it lazily
+        self._sorted_names: List[str] = []
+        self._all_names_cache: Optional[Tuple[str, ...]] = None
+        # Bumped on every mutation so callers can cache derived views
+        self._version = 0
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "ParamRegistry initialized id=%s specs=%d aliases=%d",
+                hex(id(self)),
+                len(self._specs),
+                len(self._aliases),
+            )
+
+    @property
+    def version(self) -> int:
+        """Mutation counter; changes whenever specs or aliases are registered or cleared."""
+        return self._version
 
     @staticmethod
     def _canon(name: str) -> str:
@@ -30,52 +50,91 @@ class ParamRegistry:
     def register(
         self, spec: ParamSpec, aliases: Iterable[str] = (), override: bool = False
     ) -> None:
-        key = self._canon(spec.name)
-        logger.debug(
-            "Register called: name=%r canon=%r override=%s aliases=%r",
-            spec.name,
-            key,
-            override,
-            tuple(aliases),
-        )
-        if not override and key in self._specs:
-            logger.error("Register failed: %r already registered", key)
-            raise ConfigDuplicateError({spec.name: "Parameter already registered."})
-        existed = key in self._specs
-        self._specs[key] = spec
-        if existed and override:
-            logger.debug("Spec overridden for %r", key)
-        self._register_aliases(aliases, key, override)
-        # Invalidate any external caches (e.g. resolve_param_name lru cache)
-        try:
-            clear_fn = getattr(self, "_clear_caches", None)
-            if callable(clear_fn):
-                clear_fn()
-        except Exception:
-            # best-effort: ignore cache-clear failures
-            pass
-        logger.debug(
-            "Register complete: specs=%d aliases=%d keys(sample)=%r",
-            len(self._specs),
-            len(self._aliases),
-            tuple(list(self._specs.keys())[:5]),
-        )
+        key = sys.intern(self._canon(spec.name))
+        aliases = tuple(aliases)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Register called: name=%r canon=%r override=%s aliases=%r",
+                spec.name,
+                key,
+                override,
+                aliases,
+            )
+        self._register_batch([(spec, key, aliases)], override)
+
+    def register_many(
+        self, items: Iterable[Tuple[ParamSpec, Iterable[str]]], *, override: bool = False
+    ) -> None:
+        """Register (spec, aliases) pairs as one batch.
+
+        Every duplicate and alias conflict is checked before anything is stored,
+        so a failing batch leaves the registry unchanged. Caches are invalidated
+        once per batch rather than once per spec.
+        """
+        # Interned so callers passing the canonical literal hit the lookup by identity
+        batch = [
+            (spec, sys.intern(self._canon(spec.name)), tuple(aliases)) for spec, aliases in items
+        ]
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Register called: %d spec(s) override=%s names=%r aliases=%r",
+                len(batch),
+                override,
+                tuple(key for _, key, _ in batch),
+                tuple(a for _, _, aliases in batch for a in aliases),
+            )
+        self._register_batch(batch, override)
 
-    def _register_aliases(self, aliases: Iterable[str], key: str, override: bool) -> None:
-        for a in aliases:
-            ak = self._canon(a)
-            if not override and ak in self._aliases and self._aliases[ak] != key:
-                logger.error("Alias conflict: %r already points to %r", ak, self._aliases[ak])
-                raise ConfigValidationError({a: f"Alias already used for {self._aliases[ak]}."})
+    def _register_batch(
+        self, batch: List[Tuple[ParamSpec, str, Tuple[str, ...]]], override: bool
+    ) -> None:
+        # Pass 1: check the whole batch against the registry and itself
+        batch_keys: Dict[str, ParamSpec] = {}
+        alias_map: Dict[str, str] = {}
+        for spec, key, aliases in batch:
+            if not override and (key in self._specs or key in batch_keys):
+                logger.error("Register failed: %r already registered", key)
+                raise ConfigDuplicateError({spec.name: "Parameter already registered."})
+            batch_keys[key] = spec
+            for a in aliases:
+                ak = sys.intern(self._canon(a))
+                prev = alias_map.get(ak) or self._aliases.get(ak)
+                if prev is not None and prev != key and not override:
+                    logger.error("Alias conflict: %r already points to %r", ak, prev)
+                    raise ConfigValidationError({a: f"Alias already used for {prev}."})
+                alias_map[ak] = key
+
+        # Pass 2: store
+        for key, spec in batch_keys.items():
+            if key in self._specs:
+                logger.debug("Spec overridden for %r", key)
+            else:
+                insort(self._sorted_names, key)
+                self._all_names_cache = None
+            self._specs[key] = spec
+            self._lookup[key] = key
+        for ak, key in alias_map.items():
             self._aliases[ak] = key
+            if ak not in self._specs:
+                self._lookup[ak] = key
             logger.debug("Alias set: %r -> %r", ak, key)
-        # Invalidate resolve caches when aliases change
+        self._version += 1
+        self._enum_cache.clear()
+        # Invalidate any external caches (e.g. resolve_param_name lru cache)
         try:
             clear_fn = getattr(self, "_clear_caches", None)
             if callable(clear_fn):
                 clear_fn()
         except Exception:
+            # best-effort: ignore cache-clear failures
             pass
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Register complete: specs=%d aliases=%d keys(sample)=%r",
+                len(self._specs),
+                len(self._aliases),
+                tuple(islice(self._specs, 5)),
+            )
 
     def has(self, name_or_alias: Union[str, Enum]) -> bool:
         try:
@@ -89,7 +148,8 @@ class ParamRegistry:
     def get(self, name_or_alias: Union[str, Enum]) -> ParamSpec:
         key = self._resolve_key(name_or_alias)
         spec = self._specs[key]
-        logger.debug("Get(%r) -> key=%r spec_id=%s", name_or_alias, key, hex(id(spec)))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Get(%r) -> key=%r spec_id=%s", name_or_alias, key, hex(id(spec)))
         return spec
 
     def resolve_name(self, name_or_alias: Union[str, Enum]) -> str:
@@ -98,46 +158,27 @@ class ParamRegistry:
         return key
 
     def _resolve_key(self, name_or_alias: Union[str, Enum]) -> str:
-        # If name_or_alias already looks like a key, try and use it directly
-        if name_or_alias in self._specs:
-            return name_or_alias
-        elif name_or_alias in self._aliases:
-            return self._aliases[name_or_alias]
+        # If name_or_alias already looks like a key or alias, use it directly
+        hit = self._lookup.get(name_or_alias)  # type: ignore[arg-type]
+        if hit is not None:
+            return hit
 
         # Detailed resolution logs
-        logger.debug(
-            "Resolving key for: %r (%s) | specs=%d aliases=%d",
-            getattr(name_or_alias, "value", name_or_alias),
-            type(name_or_alias),
-            len(self._specs),
-            len(self._aliases),
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Resolving key for: %r (%s) | specs=%d aliases=%d",
+                getattr(name_or_alias, "value", name_or_alias),
+                type(name_or_alias),
+                len(self._specs),
+                len(self._aliases),
+            )
 
-        if _is_enum(name_or_alias):
-            enum_val = getattr(name_or_alias, "value", None)
-            if not isinstance(enum_val, str):
-                logger.error("Enum value not a string: %r -> %r", name_or_alias, enum_val)
-                raise ConfigValidationError({str(name_or_alias): "Enum value must be a string."})
-            canon = self._canon(enum_val)
-            in_specs = canon in self._specs
-            in_aliases = canon in self._aliases
-            logger.debug("Enum: canon=%r in_specs=%s in_aliases=%s", canon, in_specs, in_aliases)
-            if in_specs:
-                return canon
-            if in_aliases:
-                return self._aliases[canon]
-        elif isinstance(name_or_alias, str):
-            k = self._canon(name_or_alias)
-            in_specs = k in self._specs
-            in_aliases = k in self._aliases
-            logger.debug("String: canon=%r in_specs=%s in_aliases=%s", k, in_specs, in_aliases)
-            if in_specs:
-                return k
-            if in_aliases:
-                return self._aliases[k]
+        key = _resolver_for(name_or_alias)(self, name_or_alias)
+        if key is not None:
+            return key
         # Miss path
-        all_keys_sample = tuple(list(self._specs.keys())[:10])
-        alias_sample = tuple(list(self._aliases.items())[:10])
+        all_keys_sample = tuple(islice(self._specs, 10))
+        alias_sample = tuple(islice(self._aliases.items(), 10))
         key_str = str(getattr(name_or_alias, "value", name_or_alias))
         logger.error(
             "Unknown config param: %r | specs=%d aliases=%d | specs(sample)=%r aliases(sample)=%r",
@@ -150,7 +191,9 @@ class ParamRegistry:
         raise ConfigNotFoundError({str(self._canon(key_str)): "Unknown configuration parameter."})
 
     def all_names(self) -> Tuple[str, ...]:
-        names = tuple(sorted(self._specs.keys()))
+        names = self._all_names_cache
+        if names is None:
+            names = self._all_names_cache = tuple(self._sorted_names)
         logger.debug("All_names() -> %d keys", len(names))
         return names
 
@@ -158,6 +201,11 @@ class ParamRegistry:
         logger.debug("Clearing registry: specs=%d aliases=%d", len(self._specs), len(self._aliases))
         self._specs.clear()
         self._aliases.clear()
+        self._lookup.clear()
+        self._enum_cache.clear()
+        self._sorted_names.clear()
+        self._all_names_cache = None
+        self._version += 1
         try:
             clear_fn = getattr(self, "_clear_caches", None)
             if callable(clear_fn):
@@ -167,8 +215,43 @@ class ParamRegistry:
         logger.debug("Registry cleared.")
 
 
-def _is_enum(x: object) -> bool:
-    try:
-        return isinstance(x, Enum)
-    except Exception:
-        return False
+def _resolve_enum(registry: ParamRegistry, name_or_alias: Any) -> Optional[str]:
+    enum_val = getattr(name_or_alias, "value", None)
+    if not isinstance(enum_val, str):
+        logger.error("Enum value not a string: %r -> %r", name_or_alias, enum_val)
+        raise ConfigValidationError({str(name_or_alias): "Enum value must be a string."})
+    cached = registry._enum_cache.get(enum_val)
+    if cached is not None:
+        return cached
+    canon = registry._canon(enum_val)
+    hit = registry._lookup.get(canon)
+    logger.debug("Enum: canon=%r -> %r", canon, hit)
+    if hit is not None:
+        registry._enum_cache[enum_val] = hit
+    return hit
+
+
+def _resolve_str(registry: ParamRegistry, name_or_alias: Any) -> Optional[str]:
+    k = registry._canon(name_or_alias)
+    hit = registry._lookup.get(k)
+    logger.debug("String: canon=%r -> %r", k, hit)
+    return hit
+
+
+def _resolve_unsupported(registry: ParamRegistry, name_or_alias: Any) -> Optional[str]:
+    return None
+
+
+_Resolver = Callable[[ParamRegistry, Any], Optional[str]]
+
+
+def _resolver_for(name_or_alias: Any) -> _Resolver:
+    # Not memoized per type: a type-keyed table would keep every Enum class alive
+    if type(name_or_alias) is str:
+        return _resolve_str
+    # Enum is checked before str so str-mixin enums resolve through their value
+    if isinstance(name_or_alias, Enum):
+        return _resolve_enum
+    if isinstance(name_or_alias, str):
+        return _resolve_str
+    return _resolve_unsupported
@@ -1,12 +1,85 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any, Callable, Dict, Optional, Tuple, Type, Union
+import sys
+from dataclasses import dataclass, field
+from functools import partial
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple, Type, Union
 
 from config_guard.exceptions import ConfigValidationError
+from config_guard.utils import _BOUNDED_LEN_TYPES, _IMMUTABLE_LEAF, _NUM_TYPES
 
+_Bound = Union[int, float]
 
-@dataclass(frozen=True)
+# Max remembered values per spec when memoize_validator is set
+_MEMO_SIZE = 256
+
+
+def _no_bounds(value: Any) -> bool:
+    return True
+
+
+# Both checkers keep the bool contract for values of the wrong type (no len(), not comparable)
+def _len_in_bounds(lo: _Bound, hi: _Bound, value: Any) -> bool:
+    try:
+        return lo <= len(value) <= hi
+    except TypeError:
+        return False
+
+
+def _num_in_bounds(lo: _Bound, hi: _Bound, value: Any) -> bool:
+    try:
+        return bool(lo <= value <= hi)
+    except TypeError:
+        return False
+
+
+# What a bound measures for each value type seen by _any_in_bounds: "len", "num" or None
+_BOUNDS_KIND: Dict[type, Optional[str]] = {}
+
+
+def _bounds_kind(t: type) -> Optional[str]:
+    if issubclass(t, _BOUNDED_LEN_TYPES):
+        kind: Optional[str] = "len"
+    elif issubclass(t, _NUM_TYPES):
+        kind = "num"
+    else:
+        kind = None
+    _BOUNDS_KIND[t] = kind
+    return kind
+
+
+def _any_in_bounds(bounds: Tuple[_Bound, _Bound], value: Any) -> bool:
+    lo, hi = bounds
+    t = type(value)
+    kind = _BOUNDS_KIND[t] if t in _BOUNDS_KIND else _bounds_kind(t)
+    if kind == "len":
+        return lo <= len(value) <= hi
+    elif kind == "num":
+        return bool(lo <= value <= hi)
+    return True
+
+
+def _compile_bounds_check(
+    value_type: Union[Type[Any], Tuple[Type[Any], ...]], bounds: Optional[Tuple[_Bound, _Bound]]
+) -> Callable[[Any], bool]:
+    """Pick the cheapest bounds check that is correct for every value of `value_type`."""
+    if bounds is None:
+        return _no_bounds
+    types = value_type if isinstance(value_type, tuple) else (value_type,)
+    try:
+        lo, hi = bounds
+        if all(issubclass(t, _BOUNDED_LEN_TYPES) for t in types):
+            return partial(_len_in_bounds, lo, hi)
+        if all(issubclass(t, _NUM_TYPES) for t in types):
+            return partial(_num_in_bounds, lo, hi)
+    except (TypeError, ValueError):
+        # Malformed bounds or value_type; defer errors to the generic check
+        pass
+    return partial(_any_in_bounds, bounds)
+
+
+@dataclass(frozen=True, slots=True)
 class ParamSpec:
     name: str
     default: Any
@@ -16,55 +89,83 @@ class ParamSpec:
     description: Optional[str] = None
     require_reason: bool = False
     allow_none: bool = True
+    memoize_validator: bool = False
+    _bounds_checker: Callable[[Any], bool] = field(init=False, repr=False, compare=False)
+    _type_tuple: Tuple[Any, ...] = field(init=False, repr=False, compare=False)
+    _type_spec_ok: bool = field(init=False, repr=False, compare=False)
+    _has_bounds: bool = field(init=False, repr=False, compare=False)
+    _has_validator: bool = field(init=False, repr=False, compare=False)
+    _validate_fn: Callable[[Any], None] = field(init=False, repr=False, compare=False)
+    _hash: int = field(init=False, repr=False, compare=False)
+    _mapping_cache: Optional[Mapping[str, Any]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
-    def validate(self, value: Any) -> None:
-        if value is None:
-            if not self.allow_none:
-                raise ConfigValidationError({self.name: "None value not allowed."})
-            return
-
+    def __post_init__(self) -> None:
+        # Specs are long-lived and names/descriptions repeat across registries
+        # and aliases; interning shares one copy and speeds up key comparisons.
+        # sys.intern only accepts exact str instances.
+        if type(self.name) is str:
+            object.__setattr__(self, "name", sys.intern(self.name))
+        if type(self.description) is str:
+            object.__setattr__(self, "description", sys.intern(self.description))
+        # Equal specs always share a name, so the name hash is a valid spec hash;
+        # it also keeps specs with unhashable defaults usable as dict keys.
+        object.__setattr__(self, "_hash", hash(self.name))
+        object.__setattr__(
+            self, "_bounds_checker", _compile_bounds_check(self.value_type, self.bounds)
+        )
+        type_tuple = self.value_type if isinstance(self.value_type, tuple) else (self.value_type,)
+        object.__setattr__(self, "_type_tuple", type_tuple)
+        # Probe the type spec once; isinstance only raises TypeError for a malformed spec
         try:
-            if not isinstance(value, self.value_type):
-                raise ConfigValidationError(
-                    {self.name: f"Expected value_type {self.value_type}, got {type(value)}."}
-                )
-        except TypeError as e:
-            raise ConfigValidationError(
-                {self.name: f"Invalid value_type specification {self.value_type}."}
-            ) from e
+            isinstance(None, type_tuple)
+            type_spec_ok = True
+        except TypeError:
+            type_spec_ok = False
+        object.__setattr__(self, "_type_spec_ok", type_spec_ok)
+        object.__setattr__(self, "_has_bounds", self.bounds is not None)
+        object.__setattr__(self, "_has_validator", self.validator is not None)
+        object.__setattr__(self, "_validate_fn", _compile_validate(self))
 
-        if not self._bounds_check(value):
-            assert self.bounds is not None
-            lo, hi = self.bounds
-            raise ConfigValidationError({self.name: f"Value {value} out of bounds [{lo}, {hi}]."})
+    def __hash__(self) -> int:
+        return self._hash
 
-        if self.validator is not None:
-            try:
-                valid = self.validator(value)
-                if not valid:
-                    raise ConfigValidationError({self.name: "Custom validator returned False."})
-            except Exception as e:
-                raise ConfigValidationError(
-                    {self.name: f"Custom validator raised exception: {e}"}
-                ) from e
+    def __reduce__(self) -> Tuple[Any, Tuple[Any, ...]]:
+        # Pickle the init fields only; derived fields (compiled closures) are rebuilt
+        return (
+            type(self),
+            (
+                self.name,
+                self.default,
+                self.value_type,
+                self.validator,
+                self.bounds,
+                self.description,
+                self.require_reason,
+                self.allow_none,
+                self.memoize_validator,
+            ),
+        )
 
-        if not isinstance(self.require_reason, bool):
-            raise ConfigValidationError({self.name: "require_reason must be a boolean value."})
+    def validate(self, value: Any) -> None:
+        self._validate_fn(value)
 
     def _bounds_check(self, value: Any) -> bool:
-        if self.has_bounds():
-            assert self.bounds is not None
-            lo, hi = self.bounds
-            if isinstance(value, (str, list, tuple, dict)):
-                return lo <= len(value) <= hi
-            elif isinstance(value, (int, float)):
-                return lo <= value <= hi
-        return True
+        return self._bounds_checker(value)
 
     def has_bounds(self) -> bool:
-        return self.bounds is not None
+        return self._has_bounds
 
     def to_mapping(self) -> Dict[str, Any]:
+        # Callers own the result; internal readers use the shared _mapping()
+        return dict(self._mapping())
+
+    def _mapping(self) -> Mapping[str, Any]:
+        # The spec is frozen, so the mapping is built once and shared read-only
+        cached = self._mapping_cache
+        if cached is not None:
+            return cached
         d: Dict[str, Any] = {"default": self.default, "value_type": self.value_type}
         if self.validator is not None:
             d["validator"] = self.validator
@@ -74,7 +175,123 @@ class ParamSpec:
             d["description"] = self.description
         if self.require_reason:
             d["require_reason"] = True
-        return d
+        cached = MappingProxyType(d)
+        object.__setattr__(self, "_mapping_cache", cached)
+        return cached
 
     def __getitem__(self, item: str) -> Any:
-        return self.to_mapping()[item]
+        return self._mapping()[item]
+
+
+def _compile_validate(spec: ParamSpec) -> Callable[[Any], None]:
+    """Build the validate() body for `spec` with only the steps it needs.
+
+    The spec is frozen, so which checks apply (type, bounds, custom validator)
+    is known up front; fields are bound as closure locals to avoid attribute
+    loads on every call.
+    """
+    name = spec.name
+    value_type = spec.value_type
+    type_tuple = spec._type_tuple
+    allow_none = spec.allow_none
+
+    def check_none() -> None:
+        if not allow_none:
+            raise ConfigValidationError({name: "None value not allowed."})
+
+    steps: List[Callable[[Any], None]] = []
+
+    if spec._type_spec_ok:
+        # Exact-type hits take one set probe; subclasses fall through to isinstance
+        exact_types = frozenset(type_tuple)
+
+        def check_type(value: Any) -> None:
+            if type(value) not in exact_types and not isinstance(value, type_tuple):
+                raise ConfigValidationError(
+                    {name: f"Expected value_type {value_type}, got {type(value)}."}
+                )
+
+    else:
+
+        def check_type(value: Any) -> None:
+            raise ConfigValidationError({name: f"Invalid value_type specification {value_type}."})
+
+    steps.append(check_type)
+
+    if spec._has_bounds:
+        bounds_checker = spec._bounds_checker
+        bounds = spec.bounds
+
+        def check_bounds(value: Any) -> None:
+            if not bounds_checker(value):
+                assert bounds is not None
+                lo, hi = bounds
+                raise ConfigValidationError({name: f"Value {value} out of bounds [{lo}, {hi}]."})
+
+        steps.append(check_bounds)
+
+    if spec._has_validator:
+        validator = spec.validator
+        assert validator is not None
+
+        def check_custom(value: Any) -> None:
+            try:
+                valid = validator(value)
+                if not valid:
+                    raise ConfigValidationError({name: "Custom validator returned False."})
+            except Exception as e:
+                raise ConfigValidationError(
+                    {name: f"Custom validator raised exception: {e}"}
+                ) from e
+
+        steps.append(check_custom)
+
+    if not isinstance(spec.require_reason, bool):
+
+        def check_reason(value: Any) -> None:
+            raise ConfigValidationError({name: "require_reason must be a boolean value."})
+
+        steps.append(check_reason)
+
+    if len(steps) == 1 and spec._type_spec_ok:
+        # Common case: type check only, inlined
+        def validate(value: Any) -> None:
+            if value is None:
+                check_none()
+            elif type(value) not in exact_types and not isinstance(value, type_tuple):
+                raise ConfigValidationError(
+                    {name: f"Expected value_type {value_type}, got {type(value)}."}
+                )
+
+        return validate
+
+    steps_t = tuple(steps)
+
+    def validate_steps(value: Any) -> None:
+        if value is None:
+            check_none()
+            return
+        for step in steps_t:
+            step(value)
+
+    if not (spec.memoize_validator and spec._has_validator):
+        return validate_steps
+
+    # Opt-in for pure validators: remember scalar values that passed. Keys carry the
+    # exact type so equal values of different types (1, 1.0, True) are checked separately.
+    passed: Dict[Tuple[type, Any], None] = {}
+
+    def validate_memo(value: Any) -> None:
+        t = type(value)
+        if t not in _IMMUTABLE_LEAF:
+            validate_steps(value)
+            return
+        key = (t, value)
+        if key in passed:
+            return
+        validate_steps(value)
+        if len(passed) >= _MEMO_SIZE:
+            passed.clear()
+        passed[key] = None
+
+    return validate_memo
@@ -6,14 +6,24 @@ from types import MappingProxyType
 from typing import Any, Dict, Optional, Tuple
 
 from config_guard.history import History
-from config_guard.params import get_param_spec, resolve_and_get, resolve_param_name
+from config_guard.params import get_param_spec, resolve_and_get
 from config_guard.params.spec import ParamSpec
 from config_guard.store.adaptors import PersistanceAdapterProtocol
-from config_guard.utils import _immutable_copy
+from config_guard.utils import _immutable_copy, _is_deeply_frozen
 
 logger = logging.getLogger("config_guard.store")
 logger.addHandler(logging.NullHandler())
 
+# Marks "no use-once value" so stored None values are still returned
+_SENTINEL = object()
+
+
+def _detached(value: Any) -> Any:
+    """Return `value` itself if deeply immutable, otherwise a deep copy."""
+    if _is_deeply_frozen(value):
+        return value
+    return deepcopy(value)
+
 
 class ConfigStore:
     def __init__(
@@ -27,6 +37,8 @@ class ConfigStore:
         self._mutable_types = mutable_types
         self._persistance_adapter = persistance_adapter
         self._history = history
+        # Read-only view of _config shared between snapshots until the next mutation
+        self._snapshot_cache: Optional[MappingProxyType[str, Any]] = None
         if self._persistance_adapter is not None:
             self.load()
 
@@ -35,6 +47,13 @@ class ConfigStore:
     def allows_mutable_types(self) -> bool:
         return self._mutable_types
 
+    def resolve(self, key: Any) -> Tuple[str, ParamSpec]:
+        """Canonical name and spec for `key`.
+
+        Backed by the bounded resolve_and_get cache, which the registry clears on change.
+        """
+        return resolve_and_get(key)
+
     def set(
         self,
         key: str,
@@ -44,8 +63,7 @@ class ConfigStore:
         reason: str = "",
         modified_by: str = "unknown",
     ) -> None:
-        # Resolve and fetch ParamSpec in one call to avoid double lookups
-        name, param_spec = resolve_and_get(key)
+        name, param_spec = self.resolve(key)
         if param_spec.require_reason and not reason:
             logger.error("Setting config key '%s' requires a reason", name)
             raise ValueError(f"Setting config key '{name}' requires a reason")
@@ -56,40 +74,40 @@ class ConfigStore:
 
         self._check_type(name, imm_value, param_spec)
 
-        self._check_bounds(param_spec, imm_value)
+        # _has_bounds is fixed when the spec is built; unbounded params skip the call
+        if param_spec._has_bounds:
+            self._check_bounds(param_spec, imm_value)
         param_spec.validate(imm_value)
 
         tgt[name] = imm_value
+        if permanent:
+            self._snapshot_cache = None
 
-        # Record history if available
-        try:
-            if self._history is not None:
-                self._history.add_entry(
-                    modified_by=modified_by,
-                    keys=[name],
-                    reason=reason,
-                    before=before_snapshot,
-                    after={name: imm_value},
-                )
-        except Exception:
-            # history is best-effort
-            pass
+        # Record history if available (best-effort; History swallows its own errors)
+        if self._history is not None:
+            self._history.add_entry(
+                modified_by=modified_by,
+                keys=[name],
+                reason=reason,
+                before=before_snapshot,
+                after={name: imm_value},
+            )
 
     def _check_type(self, key: str, value: Any, param_spec: ParamSpec | None = None) -> None:
-        if key in self._config and not self._mutable_types:
-            existing_type_obj = type(self._config[key])
+        if self._mutable_types:
+            return
+        existing = self._config.get(key, _SENTINEL)
+        if existing is not _SENTINEL:
+            existing_type_obj = type(existing)
+            # Re-setting a value of the same type is always allowed
+            if existing_type_obj is type(value):
+                return
             if param_spec is None:
                 param_spec = get_param_spec(key)
             new_type = type(value)
 
             existing_types: Tuple[type, ...] = (existing_type_obj,)
-
-            if isinstance(param_spec.value_type, tuple):
-                param_spec_types: Tuple[type, ...] = param_spec.value_type
-            else:
-                param_spec_types = (param_spec.value_type,)
-
-            allowed_types: Tuple[type, ...] = param_spec_types + existing_types
+            allowed_types: Tuple[type, ...] = param_spec._type_tuple + existing_types
 
             if new_type not in allowed_types:
                 logger.error(
@@ -103,10 +121,13 @@ class ConfigStore:
                 )
 
     def _check_bounds(self, param_spec: ParamSpec, value: Any) -> None:
-        if param_spec is None or param_spec.bounds is None:
+        if param_spec is None:
+            return
+        bounds = param_spec.bounds
+        if bounds is None or not isinstance(value, (int, float)):
             return
-        lo, hi = param_spec.bounds
-        if isinstance(value, (int, float)) and not (lo <= value <= hi):
+        lo, hi = bounds
+        if not (lo <= value <= hi):
             logger.error(
                 "Value %r for config key '%s' out of bounds [%s, %s]",
                 value,
@@ -119,12 +140,12 @@ class ConfigStore:
             )
 
     def get(self, key: str, default: Any = None) -> Any:
-        key = resolve_param_name(key)
+        key = self.resolve(key)[0]
 
-        if key in self._use_once:
-            val = self._use_once.pop(key)
-            return deepcopy(val)
-        return deepcopy(self._config.get(key, default))
+        val = self._use_once.pop(key, _SENTINEL)
+        if val is not _SENTINEL:
+            return _detached(val)
+        return _detached(self._config.get(key, default))
 
     def load(self) -> None:
         if self._persistance_adapter is None:
@@ -136,6 +157,7 @@ class ConfigStore:
                 logger.error("PersistanceAdapter.load() did not return a dict")
                 raise ValueError("PersistanceAdapter.load() must return a dict")
             self._config = {k: _immutable_copy(v) for k, v in loaded_config.items()}
+            self._snapshot_cache = None
             self._use_once.clear()
             logger.debug("ConfigStore loaded config from persistance adapter: %r", self._config)
         except Exception as e:
@@ -153,42 +175,82 @@ class ConfigStore:
             logger.error("Error saving config to persistance adapter: %s", e)
             raise
 
+    def _snapshot(self) -> MappingProxyType[str, Any]:
+        cached = self._snapshot_cache
+        if cached is not None:
+            return cached
+        values: Dict[str, Any] = {}
+        shareable = True
+        for k, v in self._config.items():
+            if _is_deeply_frozen(v):
+                values[k] = v
+            else:
+                values[k] = deepcopy(v)
+                shareable = False
+        snap = MappingProxyType(values)
+        # Only cache when every value is deeply immutable; anything else needs a fresh copy per call
+        if shareable:
+            self._snapshot_cache = snap
+        return snap
+
     def snapshot_internal(self) -> Dict[str, Any]:
-        return {k: deepcopy(v) for k, v in self._config.items()}
+        """Dict copy of the stored values; mutable values are deep-copied, frozen ones shared."""
+        return dict(self._snapshot())
 
     def snapshot_public(self) -> MappingProxyType[str, Any]:
-        return MappingProxyType({k: deepcopy(v) for k, v in self._config.items()})
+        """Read-only point-in-time view, shared between calls until the next mutation."""
+        return self._snapshot()
+
+    def keys(self) -> Tuple[str, ...]:
+        """Names of the stored parameters, without copying any values."""
+        return tuple(self._config)
+
+    def __len__(self) -> int:
+        return len(self._config)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._config
+
+    def snapshot_refs(self) -> Dict[str, Any]:
+        """Shallow copy of the stored values, to hand back unchanged to restore_frozen()."""
+        return dict(self._config)
 
     def restore(
         self, values: Dict[str, Any], *, modified_by: str = "unknown", reason: str = "restore"
     ) -> None:
+        self.restore_frozen(
+            {k: _immutable_copy(v) for k, v in values.items()},
+            modified_by=modified_by,
+            reason=reason,
+        )
+
+    def restore_frozen(
+        self, values: Dict[str, Any], *, modified_by: str = "unknown", reason: str = "restore"
+    ) -> None:
+        """Like restore(), but trusts `values` to already be _immutable_copy output."""
         before = dict(self._config)
-        self._config = {k: _immutable_copy(v) for k, v in values.items()}
+        self._config = dict(values)
+        self._snapshot_cache = None
         self._use_once.clear()
-        try:
-            if self._history is not None:
-                self._history.add_entry(
-                    modified_by=modified_by,
-                    keys=list(values.keys()),
-                    reason=reason,
-                    before=before,
-                    after=dict(self._config),
-                )
-        except Exception:
-            pass
+        if self._history is not None:
+            self._history.add_entry(
+                modified_by=modified_by,
+                keys=list(values.keys()),
+                reason=reason,
+                before=before,
+                after=self._config,
+            )
 
     def clear(self, *, modified_by: str = "unknown") -> None:
         before = dict(self._config)
         self._config.clear()
+        self._snapshot_cache = None
         self._use_once.clear()
-        try:
-            if self._history is not None:
-                self._history.add_entry(
-                    modified_by=modified_by,
-                    keys=[],
-                    reason="clear",
-                    before=before,
-                    after={},
-                )
-        except Exception:
-            pass
+        if self._history is not None:
+            self._history.add_entry(
+                modified_by=modified_by,
+                keys=[],
+                reason="clear",
+                before=before,
+                after={},
+            )
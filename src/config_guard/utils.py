@@ -4,16 +4,25 @@ import hashlib
 import json
 import os
 from copy import deepcopy
+from functools import lru_cache, partial
 from types import MappingProxyType
-from typing import Any, Dict
+from typing import Any, Callable, Dict, cast
 
 __all__ = [
+    "_BOUNDED_LEN_TYPES",
+    "_NUM_TYPES",
+    "_IMMUTABLE_LEAF",
+    "_is_deeply_frozen",
     "_immutable_copy",
     "_stable_serialize_for_checksum",
     "_checksum_of_config",
     "_require_bypass_env",
 ]
 
+# Types whose bounds apply to len(value) vs. the numeric value itself
+_BOUNDED_LEN_TYPES = (str, list, tuple, dict)
+_NUM_TYPES = (int, float)
+
 
 def _immutable_copy(value: Any) -> Any:
     try:
@@ -22,38 +31,124 @@ def _immutable_copy(value: Any) -> Any:
         raise ValueError("Value is not deepcopy-able") from e
 
 
+# Exact types that are immutable all the way down and can be shared as-is
+_IMMUTABLE_LEAF = frozenset((str, bytes, int, float, complex, bool, type(None)))
+
+
+def _is_deeply_frozen(value: Any) -> bool:
+    """True if `value` and everything nested in it is immutable, so it may be shared."""
+    t = type(value)
+    if t in _IMMUTABLE_LEAF:
+        return True
+    if t is tuple or t is frozenset:
+        return all(_is_deeply_frozen(v) for v in value)
+    if t is MappingProxyType:
+        # Proxies built by _freeze_mapping wrap a dict nothing else references
+        return all(_is_deeply_frozen(k) and _is_deeply_frozen(v) for k, v in value.items())
+    return False
+
+
+def _freeze_list(value: Any) -> Any:
+    return tuple(_recursive_immutable_copy(v) for v in value)
+
+
+def _freeze_mapping(value: Any) -> Any:
+    return MappingProxyType({k: _recursive_immutable_copy(v) for k, v in value.items()})
+
+
+def _freeze_tuple(value: Any) -> Any:
+    frozen = tuple(_recursive_immutable_copy(v) for v in value)
+    # Reuse the original tuple when none of its elements had to change
+    return value if all(a is b for a, b in zip(frozen, value, strict=True)) else frozen
+
+
+def _freeze_frozenset(value: Any) -> Any:
+    if all(type(v) in _IMMUTABLE_LEAF for v in value):
+        return value
+    return deepcopy(value)
+
+
+# Freezer per exact container type; subclasses fall through to the isinstance checks
+_FREEZERS: Dict[type, Callable[[Any], Any]] = {
+    list: _freeze_list,
+    dict: _freeze_mapping,
+    MappingProxyType: _freeze_mapping,
+    tuple: _freeze_tuple,
+    frozenset: _freeze_frozenset,
+}
+
+
 def _recursive_immutable_copy(value: Any) -> Any:
+    t = type(value)
+    if t in _IMMUTABLE_LEAF:
+        return value
     try:
+        freezer = _FREEZERS.get(t)
+        if freezer is not None:
+            return freezer(value)
         if isinstance(value, list):
-            return tuple(_recursive_immutable_copy(v) for v in value)
-        if isinstance(value, dict):
-            return MappingProxyType({k: _recursive_immutable_copy(v) for k, v in value.items()})
+            return _freeze_list(value)
+        if isinstance(value, (dict, MappingProxyType)):
+            return _freeze_mapping(value)
         return deepcopy(value)
     except Exception as e:
         raise ValueError("Value is not deepcopy-able") from e
 
 
+# Shared compact encoder; sort_keys also orders nested dicts deterministically
+_JSON_ENCODER = json.JSONEncoder(separators=(",", ":"), sort_keys=True)
+
+
+# JSON text for exact scalar types, matching what json.dumps emits for them
+_SCALAR_JSON: Dict[type, Callable[[Any], str]] = {
+    int: int.__repr__,
+    bool: lambda v: "true" if v else "false",
+    type(None): lambda v: "null",
+}
+
+
 def _stable_serialize_for_checksum(data: Dict[str, Any]) -> bytes:
-    out: Dict[str, Any] = {}
+    # Fast path: when every value is JSON-safe, one C-level encode of the whole
+    # mapping yields the same bytes as the per-value path below.
+    try:
+        return _JSON_ENCODER.encode({repr(k): v for k, v in data.items()}).encode("utf-8")
+    except Exception:
+        return _stable_serialize_slow(data)
 
-    def safe_key_func(k: object) -> str:
-        return repr(k)
 
-    for og_key in sorted(data.keys(), key=safe_key_func):
-        safe_key: str = safe_key_func(og_key)
-        val = data[og_key]
+def _stable_serialize_slow(data: Dict[str, Any]) -> bytes:
+    # Each value is encoded exactly once: the encoded fragment doubles as the
+    # serializability probe, and fragments are joined in sorted-key order.
+    encode = _JSON_ENCODER.encode
+    scalar_json = _SCALAR_JSON.get
+    fragments: Dict[str, str] = {}
+    for og_key, val in data.items():
+        safe_key = repr(og_key)
+        to_json = scalar_json(type(val))
+        if to_json is not None:
+            fragments[safe_key] = to_json(val)
+            continue
         try:
-            json.dumps(val)
-            out[safe_key] = val
+            fragments[safe_key] = encode(val)
         except Exception:
-            out[safe_key] = repr(val)
-    return json.dumps(out, separators=(",", ":"), sort_keys=True).encode("utf-8")
+            fragments[safe_key] = encode(repr(val))
+    body = ",".join(f"{encode(k)}:{fragments[k]}" for k in sorted(fragments))
+    return ("{" + body + "}").encode("utf-8")
+
+
+@lru_cache(maxsize=None)
+def _hash_constructor(algorithm: str) -> Callable[[bytes], Any]:
+    # Named constructors (hashlib.sha256, ...) skip hashlib.new's per-call name lookup
+    if algorithm in hashlib.algorithms_guaranteed:
+        return cast(Callable[[bytes], Any], getattr(hashlib, algorithm))
+    return partial(hashlib.new, algorithm)
 
 
 def _checksum_of_config(snapshot: Dict[str, Any], algorithm: str = "sha256") -> str:
     b = _stable_serialize_for_checksum(snapshot)
-    return hashlib.new(algorithm, b).hexdigest()
+    return str(_hash_constructor(algorithm)(b).hexdigest())
 
 
 def _require_bypass_env() -> bool:
-    return os.getenv("ALLOW_CONFIG_BYPASS", "") == "1"
+    # Read on every call: revoking the flag at runtime must take effect immediately
+    return os.environ.get("ALLOW_CONFIG_BYPASS") == "1"
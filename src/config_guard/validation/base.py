@@ -11,27 +11,33 @@ class ConfigValidator:
         if not isinstance(key, str):
             raise ConfigValidationError({str(key): "Key must be a str."})
 
-        # Resolve through registry (raises ConfigValidationError if unknown)
+        # Resolve through registry (raises ConfigNotFoundError if unknown)
         name, spec = resolve_and_get(key)
 
-        errors: Dict[str, str] = {}
         try:
-            # Primary validation via ParamSpec (value_type, bounds, and custom validator)
+            # ParamSpec.validate is compiled per spec (value_type, bounds, custom validator)
             spec.validate(value)
         except ConfigValidationError as exc:
-            errors.update(exc.errors)
-
-        if errors:
-            raise ConfigValidationError(errors, name, value)
-        # Return canonical name so callers don't need to resolve again
-        return name
+            errors = exc.errors
+        else:
+            # Return canonical name so callers don't need to resolve again
+            return name
+        # Raised outside the handler so the spec's error is not chained as context
+        raise ConfigValidationError(errors, name, value)
 
     def validate_mapping(self, mapping: Dict[str, Any]) -> None:
+        # Same checks as validate_value, inlined with locals bound once for large mappings
         errors: Dict[str, str] = {}
+        add_errors = errors.update
+        resolve = resolve_and_get
         for k, v in mapping.items():
+            if not isinstance(k, str):
+                errors[str(k)] = "Key must be a str."
+                continue
+            _, spec = resolve(k)
             try:
-                self.validate_value(k, v)
+                spec.validate(v)
             except ConfigValidationError as exc:
-                errors.update(exc.errors)
+                add_errors(exc.errors)
         if errors:
             raise ConfigValidationError(errors)
@@ -1,37 +1,53 @@
 # python
 import pytest
 
-from config_guard.params import REGISTRY, register_param
+from config_guard.params import REGISTRY, register_params
 
+_ALLOWED_SCHEMES: frozenset[str] = frozenset(("http", "https"))
 
-@pytest.fixture(autouse=True)
-def seed_registry():
-    REGISTRY.clear()
-    register_param(
+_SEED_PARAMS = (
+    dict(
         name="MAX_CONCURRENCY",
         default=10,
         value_type=int,
         bounds=(1, 1000),
         description="Max concurrent operations",
         aliases=("max_concurrency",),
-        override=True,
-    )
-    register_param(
+    ),
+    dict(
         name="ALLOWED_SCHEMES",
         default=["https", "http"],
         value_type=(list, tuple),
-        validator=lambda v: isinstance(v, (list, tuple)) and all(x in ("http", "https") for x in v),
+        validator=lambda v: (
+            (type(v) is list or type(v) is tuple) and _ALLOWED_SCHEMES.issuperset(v)
+        ),
         description="Allowed URL schemes",
         aliases=("allowed_schemes",),
-        override=True,
-    )
-    register_param(
+    ),
+    dict(
         name="VERIFY",
         default=True,
         value_type=bool,
         description="Whether to verify TLS",
         aliases=("verify",),
-        override=True,
-    )
+    ),
+)
+
+
+@pytest.fixture(scope="session")
+def seeded_specs():
+    # Build the specs once per session; ParamSpec is frozen, so tests can share them
+    REGISTRY.clear()
+    register_params(_SEED_PARAMS)
+    seeded = tuple((REGISTRY.get(kwargs["name"]), kwargs["aliases"]) for kwargs in _SEED_PARAMS)
+    REGISTRY.clear()
+    return seeded
+
+
+@pytest.fixture(autouse=True)
+def seed_registry(seeded_specs):
+    REGISTRY.clear()
+    for spec, aliases in seeded_specs:
+        REGISTRY.register(spec, aliases=aliases, override=True)
     yield
     REGISTRY.clear()
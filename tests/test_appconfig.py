@@ -2,7 +2,7 @@ import warnings
 
 import pytest
 
-from config_guard import AppConfig
+from config_guard import AppConfig, register_param
 from config_guard.exceptions import (
     ConfigBypassError,
     ConfigLockedError,
@@ -87,6 +87,21 @@ def test_appconfig_restore_from_snapshot_success_and_failure(app):
         app.restore_from_snapshot({"MAX_CONCURRENCY": 0})
 
 
+def test_appconfig_restore_from_snapshot_view_without_copy(app):
+    snap = app.snapshot()
+    app.update(MAX_CONCURRENCY=42)
+    app.restore_from_snapshot(snap)
+    assert app.get("MAX_CONCURRENCY") == 10
+
+
+def test_appconfig_get_detaches_nested_mutable_values(app):
+    register_param("NESTED", default=(), value_type=(list, tuple))
+    app.update(NESTED=[{1, 2}])
+    app.get("NESTED")[0].add(99)
+    assert app.get("NESTED") == ({1, 2},)
+    assert app.verify_integrity() is True
+
+
 def test_appconfig_register_hook_and_trigger(app):
     called = []
 
@@ -168,6 +183,29 @@ def test_appconfig_update_with_no_changes(app):
     assert app.get("MAX_CONCURRENCY") == 10  # default value
 
 
+def test_appconfig_empty_update_and_use_once_keep_checksum(app):
+    called = []
+    app.register_post_update_hook(called.append)
+    checksum = repr(app)
+    app.update()
+    assert called == []
+    app.use_once(MAX_CONCURRENCY=30)
+    assert len(called) == 1
+    assert repr(app) == checksum
+    assert app.verify_integrity() is True
+
+
+def test_appconfig_update_without_changes_skips_hooks(app):
+    # Hooks are post-update notifications; an update that changes nothing fires none
+    called = []
+    app.register_post_update_hook(called.append)
+    app.update()
+    app.use_once()
+    assert called == []
+    app.update(VERIFY=False)
+    assert len(called) == 1
+
+
 def test_appconfig_use_once_with_invalid_key(app):
     with pytest.raises(ConfigNotFoundError):  # Changed from ConfigValidationError
         app.use_once(UNKNOWN_KEY=123)
@@ -435,3 +473,9 @@ def test_config_multiple_teardown():
     c = AppConfig()
     c.teardown()
     c.teardown()  # should not raise
+
+
+def test_appconfig_uses_slots_and_still_forbids_assignment(app):
+    assert not hasattr(app, "__dict__")
+    with pytest.raises(AttributeError):
+        app.anything = 1
@@ -13,6 +13,9 @@ def test_config_validation_error_message_and_attrs():
     assert err.errors == {"FOO": "bad"}
     assert err.key == "FOO"
     assert err.value == 123
+    assert str(err) == "Validation errors: {'FOO': 'bad'} (key: FOO, value: 123)"
+    assert err.args == ("Validation errors: {'FOO': 'bad'} (key: FOO, value: 123)",)
+    assert repr(err) == f"ConfigValidationError({err.args[0]!r})"
 
 
 def test_custom_exceptions_are_subclasses():
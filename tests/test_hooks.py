@@ -17,6 +17,15 @@ def test_hookbus_register_and_run_success(caplog):
     assert called and called[0]["a"] == 1
 
 
+def test_hookbus_has_hooks_tracks_registration():
+    bus = HookBus()
+    assert bus.has_hooks is False
+    bus.register(lambda snapshot: None)
+    assert bus.has_hooks is True
+    bus.clear()
+    assert bus.has_hooks is False
+
+
 def test_hookbus_register_non_callable_raises():
     bus = HookBus()
     with pytest.raises(TypeError):
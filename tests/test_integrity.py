@@ -1,3 +1,7 @@
+import hashlib
+import hmac
+import json
+import os
 import time
 
 import pytest
@@ -20,6 +24,26 @@ def test_integrity_init_and_update_and_verify(monkeypatch):
     assert ig.last_checksum != first
 
 
+def test_integrity_update_snapshot_detaches_mutable_values():
+    ig = IntegrityGuard()
+    frozen = ("a", "b")
+    mutable = ["a"]
+    ig.update_snapshot({"f": frozen, "m": mutable})
+    mutable.append("b")
+    assert ig.verify() is True
+    assert ig._last_snapshot["f"] is frozen
+    assert ig._last_snapshot["m"] == ["a"]
+
+
+def test_integrity_update_snapshot_detaches_nested_sets():
+    ig = IntegrityGuard()
+    inner = {1, 2}
+    ig.update_snapshot({"t": (inner,)})
+    inner.add(3)
+    assert ig.verify() is True
+    assert ig._last_snapshot["t"] == ({1, 2},)
+
+
 def test_integrity_init_invalid_algo():
     with pytest.raises(ValueError):
         IntegrityGuard("abc123")
@@ -41,6 +65,14 @@ def test_integrity_seal_checksum(monkeypatch):
     assert sealed2 != "deadbeef"
 
 
+def test_integrity_seal_checksum_follows_key_rotation(monkeypatch):
+    ig = IntegrityGuard()
+    for key in ("first", "first", "second"):
+        monkeypatch.setenv("CONFIG_HMAC_KEY", key)
+        expected = hmac.new(key.encode(), b"deadbeef", "sha256").hexdigest()
+        assert ig.seal_checksum("deadbeef") == expected
+
+
 def test_integrity_memory_fingerprint_is_stable_type():
     ig = IntegrityGuard()
     ig.update_snapshot({"x": 42})
@@ -48,6 +80,27 @@ def test_integrity_memory_fingerprint_is_stable_type():
     assert isinstance(fp, str)
 
 
+@pytest.mark.parametrize("snapshot", [None, {"x": 42}])
+def test_integrity_memory_fingerprint_matches_json_encoding(snapshot):
+    ig = IntegrityGuard()
+    if snapshot is not None:
+        ig.update_snapshot(snapshot)
+    data = {"pid": os.getpid(), "checksum": ig.last_checksum}
+    expected = hashlib.sha256(json.dumps(data, sort_keys=True).encode()).hexdigest()
+    assert ig.memory_fingerprint() == expected
+
+
+def test_integrity_memory_fingerprint_cached_until_checksum_changes():
+    ig = IntegrityGuard()
+    ig.update_snapshot({"x": 1})
+    fp = ig.memory_fingerprint()
+    assert ig.memory_fingerprint() is fp
+    ig.update_snapshot({"x": 2})
+    assert ig.memory_fingerprint() != fp
+    ig.update_snapshot({"x": 1})
+    assert ig.memory_fingerprint() == fp
+
+
 def test_integrity_clear_and_verify():
     ig = IntegrityGuard()
     ig.update_snapshot({"x": 1})
@@ -99,3 +152,9 @@ def test_integrity_start_checker_triggers_on_violation():
     # Let the background thread run once
     time.sleep(0.05)
     assert violations and "integrity violation".lower() in violations[0].lower()
+
+
+def test_integrity_start_checker_rejects_non_positive_interval():
+    ig = IntegrityGuard()
+    with pytest.raises(ValueError):
+        ig.start_checker(is_torn_down=lambda: True, on_violation=lambda msg: None, interval=0)
@@ -1,4 +1,8 @@
 import enum
+import gc
+import logging
+import pickle
+import weakref
 
 import pytest
 
@@ -8,9 +12,11 @@ from config_guard.params import (
     ParamRegistry,
     ParamSpec,
     dump_registry_state,
+    get_all_specs,
     get_param_spec,
     list_params,
     register_param,
+    register_params,
     resolve_param_name,
 )
 
@@ -39,6 +45,19 @@ def test_paramspec_to_mapping_contains_optionals():
     m = ps.to_mapping()
     assert m["default"] is None and m["value_type"]
     assert m["description"] == "desc"
+    assert type(m) is dict and ps.to_mapping() is not m  # callers get their own dict
+    m["default"] = 1
+    assert ps.to_mapping()["default"] is None and ps["default"] is None
+
+
+def test_get_all_specs_refreshes_after_register():
+    before = get_all_specs()
+    assert type(before) is dict and get_all_specs() == before
+    before["VERIFY"]["default"] = "mutated"
+    assert get_all_specs()["VERIFY"]["default"] is True
+    register_param(name="EXTRA", default=1, value_type=int)
+    after = get_all_specs()
+    assert "EXTRA" in after and "EXTRA" not in before
 
 
 def test_paramregistry_register_and_get_and_alias_and_override():
@@ -86,6 +105,15 @@ def test_paramregistry_all_names_and_clear():
     assert reg.all_names() == tuple()
 
 
+def test_paramregistry_all_names_cache_invalidated_on_register():
+    reg = ParamRegistry()
+    reg.register(ParamSpec(name="B", default=1, value_type=int))
+    first = reg.all_names()
+    assert reg.all_names() is first  # cached
+    reg.register(ParamSpec(name="A", default=1, value_type=int))
+    assert reg.all_names() == ("A", "B")
+
+
 def test_module_functions_and_dump_registry_state_seeded(REGISTRY=REGISTRY):
     # registry is seeded by conftest
     assert "MAX_CONCURRENCY" in list_params()
@@ -123,6 +151,15 @@ def test_paramregistry_enum_alias_handling():
         reg.resolve_name(BadEnum.BAD)
 
 
+def test_paramregistry_resolves_str_mixin_enum_by_value():
+    class SP(str, enum.Enum):
+        MC = "max_concurrency"
+
+    reg = ParamRegistry()
+    reg.register(ParamSpec(name="MAX_CONCURRENCY", default=5, value_type=int))
+    assert reg.resolve_name(SP.MC) == "MAX_CONCURRENCY"
+
+
 def test_paramregistry_logging_on_operations(caplog):
     reg = ParamRegistry()
     ps = ParamSpec(name="A", default=1, value_type=int)
@@ -140,6 +177,13 @@ def test_paramregistry_logging_on_operations(caplog):
         assert any("Resolving key for" in msg for msg in caplog.messages)
 
 
+def test_paramregistry_register_generator_aliases_with_debug_logging(caplog):
+    reg = ParamRegistry()
+    with caplog.at_level("DEBUG"):
+        reg.register(ParamSpec(name="A", default=1, value_type=int), aliases=(a for a in ["x"]))
+    assert reg.resolve_name("x") == "A"
+
+
 def test_paramspec_bounds_check_and_has_bounds():
     ps_with_bounds = ParamSpec(name="B", default=5, value_type=int, bounds=(1, 10))
     assert ps_with_bounds.has_bounds() is True
@@ -151,6 +195,23 @@ def test_paramspec_bounds_check_and_has_bounds():
     assert ps_without_bounds._bounds_check(100) is True  # Always true without bounds
 
 
+def test_paramspec_bounds_check_wrong_type_returns_false():
+    num = ParamSpec(name="N", default=5, value_type=int, bounds=(1, 10))
+    assert num._bounds_check("5") is False
+    sized = ParamSpec(name="S", default="ab", value_type=str, bounds=(1, 10))
+    assert sized._bounds_check(5) is False
+
+
+def test_paramspec_bounds_check_mixed_value_type():
+    ps = ParamSpec(name="M", default=1, value_type=(int, str), bounds=(1, 3))
+    ps.validate(2)
+    ps.validate("ab")
+    with pytest.raises(ConfigValidationError):
+        ps.validate(5)
+    with pytest.raises(ConfigValidationError):
+        ps.validate("abcd")
+
+
 def test_paramspec_validator_exception_handling():
     def faulty_validator(v):
         raise ValueError("Intentional error")
@@ -326,6 +387,17 @@ def test_paramregistry_register_with_invalid_type_for_min_max():
         )
 
 
+@pytest.mark.parametrize("bounds", ["19", ("a", "z"), (1, None)])
+def test_register_param_rejects_non_numeric_bounds(bounds):
+    with pytest.raises(ValueError, match="bounds must be a tuple"):
+        register_param(name="BAD_BOUNDS", default=5, value_type=int, bounds=bounds)
+
+
+def test_register_param_rejects_non_callable_validator():
+    with pytest.raises(TypeError, match="validator must be callable"):
+        register_param(name="BAD_VALIDATOR", default=1, value_type=int, validator=1)
+
+
 def test_resolve_param_name_invalid():
     with pytest.raises(ConfigNotFoundError):
         resolve_param_name("NOT_A_PARAM")
@@ -395,3 +467,183 @@ def test_paramspec_validate_type_error():
     s = ParamSpec("A", int, 1)
     with pytest.raises(ConfigValidationError):
         s.validate("notint")
+
+
+def test_paramspec_malformed_value_type_reported_on_validate():
+    s = ParamSpec("A", 1, "not-a-type")
+    with pytest.raises(ConfigValidationError) as exc_info:
+        s.validate(1)
+    assert "Invalid value_type specification" in str(exc_info.value)
+
+
+def test_paramspec_hash_uses_name_and_allows_unhashable_defaults():
+    s1 = ParamSpec("L", [1, 2], list)
+    s2 = ParamSpec("L", [1, 2], list)
+    assert hash(s1) == hash(s2) == hash("L")
+    assert {s1: "x"}[s2] == "x"
+
+
+def test_register_params_registers_all_or_nothing():
+    register_params(
+        [
+            {"name": "RETRIES", "default": 3, "value_type": int, "aliases": ("retry_count",)},
+            {"name": "TIMEOUT", "default": 1.5, "value_type": float, "min": 0.0, "max": 60.0},
+        ]
+    )
+    assert resolve_param_name("retry_count") == "RETRIES"
+    assert get_param_spec("TIMEOUT").bounds == (0.0, 60.0)
+
+    with pytest.raises(ValueError):
+        register_params(
+            [
+                {"name": "FIRST_OK", "default": 1, "value_type": int},
+                {"name": "BAD", "default": 1, "value_type": int, "bounds": (1,)},
+            ]
+        )
+    assert "FIRST_OK" not in list_params()
+
+
+def test_register_params_rejects_per_entry_override():
+    with pytest.raises(ValueError, match="whole batch"):
+        register_params(
+            [
+                {"name": "FIRST_OK", "default": 1, "value_type": int},
+                {"name": "VERIFY", "default": False, "value_type": bool, "override": True},
+            ]
+        )
+    assert "FIRST_OK" not in list_params()
+
+
+def test_registry_names_take_precedence_over_aliases():
+    reg = ParamRegistry()
+    reg.register(ParamSpec(name="A", default=1, value_type=int), aliases=("b",))
+    assert reg.resolve_name("B") == "A"
+    # A later spec named like an existing alias shadows the alias
+    reg.register(ParamSpec(name="B", default=2, value_type=int))
+    assert reg.resolve_name("B") == "B"
+    assert reg.resolve_name("b") == "B"
+    # ...and an alias spelled like an existing name never redirects it
+    reg.register(ParamSpec(name="C", default=3, value_type=int), aliases=("a",), override=True)
+    assert reg.resolve_name("A") == "A"
+
+
+def test_paramspec_memoize_validator_skips_repeat_scalar_checks():
+    calls = []
+
+    def validator(v):
+        calls.append(v)
+        return v != 13
+
+    ps = ParamSpec(name="N", default=1, value_type=(int, float), validator=validator)
+    ps.validate(5)
+    ps.validate(5)
+    assert calls == [5, 5]  # off by default
+
+    calls.clear()
+    memo = ParamSpec(
+        name="N", default=1, value_type=(int, float), validator=validator, memoize_validator=True
+    )
+    memo.validate(5)
+    memo.validate(5)
+    memo.validate(5.0)  # equal value, different type: validated separately
+    assert calls == [5, 5.0]
+    with pytest.raises(ConfigValidationError):
+        memo.validate(13)
+    with pytest.raises(ConfigValidationError):
+        memo.validate(13)  # failures are never remembered
+
+
+def test_paramregistry_register_many_is_atomic():
+    reg = ParamRegistry()
+    reg.register(ParamSpec(name="A", default=1, value_type=int), aliases=("x",))
+    with pytest.raises(ConfigValidationError):
+        reg.register_many(
+            [
+                (ParamSpec(name="B", default=2, value_type=int), ("y",)),
+                (ParamSpec(name="C", default=3, value_type=int), ("x",)),
+            ]
+        )
+    assert reg.all_names() == ("A",)
+    with pytest.raises(ConfigNotFoundError):
+        reg.resolve_name("y")
+
+    with pytest.raises(ConfigDuplicateError):
+        reg.register_many(
+            [
+                (ParamSpec(name="D", default=1, value_type=int), ()),
+                (ParamSpec(name="d", default=2, value_type=int), ()),
+            ]
+        )
+    assert reg.all_names() == ("A",)
+
+    version = reg.version
+    reg.register_many(
+        [
+            (ParamSpec(name="B", default=2, value_type=int), ("y",)),
+            (ParamSpec(name="C", default=3, value_type=int), ()),
+        ]
+    )
+    assert reg.all_names() == ("A", "B", "C")
+    assert reg.resolve_name("y") == "B"
+    assert reg.version == version + 1
+
+
+def test_paramspec_is_slotted_and_picklable():
+    ps = ParamSpec(name="P", default=3, value_type=int, bounds=(1, 5), description="d")
+    assert not hasattr(ps, "__dict__")
+    clone = pickle.loads(pickle.dumps(ps))
+    assert clone == ps and hash(clone) == hash(ps)
+    clone.validate(4)
+    with pytest.raises(ConfigValidationError):
+        clone.validate(6)
+
+
+def test_paramregistry_resolving_does_not_keep_enum_classes_alive():
+    reg = ParamRegistry()
+    reg.register(ParamSpec(name="A", default=1, value_type=int), aliases=("x",))
+    throwaway = enum.Enum("Throwaway", {"X": "x"})
+    assert reg.resolve_name(throwaway.X) == "A"
+    ref = weakref.ref(throwaway)
+    del throwaway
+    gc.collect()
+    assert ref() is None
+
+
+def test_paramregistry_register_logs_name_and_canon(caplog):
+    caplog.set_level(logging.DEBUG, logger="config_guard.params")
+    reg = ParamRegistry()
+    reg.register(ParamSpec(name=" a ", default=1, value_type=int), aliases=("x",))
+    assert "Register called: name=' a ' canon='A' override=False aliases=('x',)" in caplog.text
+
+
+def test_paramregistry_version_tracks_mutations():
+    reg = ParamRegistry()
+    start = reg.version
+    reg.register(ParamSpec(name="A", default=1, value_type=int))
+    assert reg.version == start + 1
+    reg.clear()
+    assert reg.version == start + 2
+    with pytest.raises(AttributeError):
+        reg.version = 0
+
+
+def test_paramregistry_enum_cache_follows_alias_changes():
+    class K(enum.Enum):
+        X = "x"
+
+    reg = ParamRegistry()
+    reg.register(ParamSpec(name="A", default=1, value_type=int), aliases=("x",))
+    assert reg.resolve_name(K.X) == "A"
+    assert reg._enum_cache == {"x": "A"}
+    reg.register(ParamSpec(name="B", default=2, value_type=int), aliases=("x",), override=True)
+    assert reg.resolve_name(K.X) == "B"
+
+
+def test_dump_registry_state_refreshes_after_registration():
+    first = dump_registry_state()
+    first["specs_count"] = -1  # callers cannot corrupt the cached state
+    assert dump_registry_state()["specs_count"] == 3
+    register_param("EXTRA", default=1, value_type=int)
+    state = dump_registry_state()
+    assert state["specs_count"] == 4 and "EXTRA" in state["specs_sample"]
+    assert len(dump_registry_state(max_items=1)["specs_sample"]) == 1
@@ -327,3 +327,74 @@ def test_configstore_save_adapter_error():
     store = ConfigStore(persistance_adapter=BadAdapter())
     with pytest.raises(RuntimeError):
         store.save()
+
+
+def test_configstore_get_shares_immutable_values_and_copies_mutable_ones():
+    register_param("TAGS", default=None, value_type=(tuple, set), description="Tags")
+    store = ConfigStore()
+    store.set("TAGS", ["a", "b"], permanent=True)
+    assert store.get("TAGS") is store.get("TAGS")  # frozen tuple is shared
+
+    store.set("TAGS", {"a"}, permanent=True)
+    got = store.get("TAGS")
+    got.add("b")
+    assert store.get("TAGS") == {"a"}  # sets are still copied out
+
+
+def test_configstore_resolve_cache_follows_registry_overrides():
+    register_param("LIMIT", default=1, value_type=int, bounds=(1, 10))
+    store = ConfigStore()
+    store.set("limit", 5, permanent=True)
+    register_param("LIMIT", default=1, value_type=int, bounds=(1, 3), override=True)
+    with pytest.raises(ValueError):
+        store.set("limit", 5, permanent=True)
+
+
+def test_configstore_snapshot_public_reused_until_mutation():
+    store = ConfigStore()
+    store.set("MAX_CONCURRENCY", 5, permanent=True)
+    first = store.snapshot_public()
+    assert store.snapshot_public() is first
+    store.set("MAX_CONCURRENCY", 6, permanent=True)
+    second = store.snapshot_public()
+    assert second is not first
+    assert first["MAX_CONCURRENCY"] == 5 and second["MAX_CONCURRENCY"] == 6
+
+
+def test_configstore_snapshot_detaches_nested_sets():
+    register_param("NESTED", default=(), value_type=(list, tuple))
+    store = ConfigStore()
+    store.set("NESTED", [{1, 2}], permanent=True)
+    first = store.snapshot_public()
+    assert store.snapshot_public() is not first  # not cached: the set is still mutable
+    first["NESTED"][0].add(99)
+    store.snapshot_internal()["NESTED"][0].add(98)
+    assert store.get("NESTED") == ({1, 2},)
+    assert store.snapshot_public()["NESTED"] == ({1, 2},)
+
+
+def test_configstore_restore_frozen_round_trips_refs():
+    store = ConfigStore()
+    store.set("ALLOWED_SCHEMES", ["https"], permanent=True)
+    refs = store.snapshot_refs()
+    store.set("ALLOWED_SCHEMES", ["http"], permanent=True)
+    store.restore_frozen(refs)
+    assert store.get("ALLOWED_SCHEMES") is refs["ALLOWED_SCHEMES"]
+
+
+def test_configstore_resolve_returns_canonical_name_and_spec():
+    store = ConfigStore()
+    name, spec = store.resolve("max_concurrency")
+    assert name == "MAX_CONCURRENCY" and spec.name == name
+    assert store.resolve("max_concurrency") == (name, spec)
+    with pytest.raises(ConfigNotFoundError):
+        store.resolve("NOT_A_PARAM")
+
+
+def test_configstore_keys_len_contains():
+    store = ConfigStore()
+    store.set("MAX_CONCURRENCY", 5, permanent=True)
+    store.set("VERIFY", False, permanent=False)  # use-once values are not stored keys
+    assert store.keys() == ("MAX_CONCURRENCY",)
+    assert len(store) == 1
+    assert "MAX_CONCURRENCY" in store and "VERIFY" not in store
@@ -61,6 +61,15 @@ def test_stable_serialize_handles_non_json_values():
     _stable_serialize_for_checksum(data)
 
 
+def test_stable_serialize_fast_path_matches_per_value_path():
+    from config_guard.utils import _stable_serialize_slow
+
+    plain = {"b": [1, 2.5, None], "a": {"z": True, "y": "s"}, 3: (1, "x")}
+    mixed = dict(plain, x=object(), m=MappingProxyType({"k": 1}))
+    assert _stable_serialize_for_checksum(plain) == _stable_serialize_slow(plain)
+    assert _stable_serialize_for_checksum(mixed) == _stable_serialize_slow(mixed)
+
+
 def test_require_bypass_env(monkeypatch):
     monkeypatch.delenv("ALLOW_CONFIG_BYPASS", raising=False)
     assert _require_bypass_env() is False
@@ -132,6 +141,21 @@ def test_immutable_copy_with_tuple():
     assert isinstance(immutable, tuple)
 
 
+def test_immutable_copy_shares_already_immutable_values():
+    value = (1, "a", (2.0, None))
+    assert _immutable_copy(value) is value
+    frozen = frozenset({1, 2})
+    assert _immutable_copy(frozen) is frozen
+
+
+def test_immutable_copy_freezes_nested_containers_in_tuples_and_proxies():
+    frozen = _immutable_copy((1, [2, 3]))
+    assert frozen == (1, (2, 3))
+    proxy = _immutable_copy(MappingProxyType({"a": [1]}))
+    assert isinstance(proxy, MappingProxyType)
+    assert proxy["a"] == (1,)
+
+
 def test_immutable_copy_with_set():
     value = {1, 2, 3}
     immutable = _immutable_copy(value)